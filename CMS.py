@@ -7,179 +7,318 @@ Features:
 Database: SQLite
 """
 
+import atexit
 import sqlite3
 import hashlib
+import hmac
 import getpass
-from dataclasses import dataclass
+import queue
+import re
+import sys
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from datetime import datetime
+from itertools import islice
+from typing import NamedTuple
 
 
 # =========================
 # Database Layer
 # =========================
 
+class SQLitePool:
+    """Fixed-size pool of pre-opened connections, checked out per call."""
+
+    def __init__(self, connect: Callable[[], sqlite3.Connection], size: int = 4, timeout: float = 5.0):
+        self.timeout = timeout
+        self._all = [connect() for _ in range(size)]
+        self._idle: queue.Queue[sqlite3.Connection] = queue.Queue()
+        for conn in self._all:
+            self._idle.put(conn)
+        # Connection pinned to the current thread by connection()/transaction()
+        self._local = threading.local()
+
+    def _checkout(self) -> sqlite3.Connection:
+        # Fail loudly instead of hanging forever if every connection is held (e.g. by unfinished iterators)
+        try:
+            return self._idle.get(timeout=self.timeout)
+        except queue.Empty:
+            raise sqlite3.OperationalError("No free database connection in the pool.") from None
+
+    def acquire(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        return conn if conn is not None else self._checkout()
+
+    def release(self, conn: sqlite3.Connection) -> None:
+        if conn is not getattr(self._local, "conn", None):
+            self._idle.put(conn)
+
+    @contextmanager
+    def connection(self):
+        # Pin one connection to this thread; acquire() calls inside the block reuse it
+        if getattr(self._local, "conn", None) is not None:
+            yield self._local.conn
+            return
+        conn = self._checkout()
+        self._local.conn = conn
+        try:
+            yield conn
+        finally:
+            self._local.conn = None
+            self._idle.put(conn)
+
+    @contextmanager
+    def transaction(self):
+        # Explicit BEGIN/COMMIT so a group of statements shares one commit. IMMEDIATE takes
+        # the write lock up front, so a read followed by a write cannot fail halfway.
+        with self.connection() as conn:
+            conn.execute("BEGIN IMMEDIATE;")
+            try:
+                yield conn
+                conn.execute("COMMIT;")
+            except BaseException:
+                # Also covers a failed COMMIT: never hand a connection back mid-transaction
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK;")
+                raise
+
+    def close(self) -> None:
+        for conn in self._all:
+            conn.close()
+        self._all = []
+
+
 class DBConnection:
-    def __init__(self, db_path: str = "clinic.db"):
+    def __init__(self, db_path: str = "clinic.db", pool_size: int = 4):
         self.db_path = db_path
-
-    def connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
+        self.journal_mode = ""
+        self.pool = SQLitePool(self._open, pool_size)
+        atexit.register(self.close)
+
+    def _open(self) -> sqlite3.Connection:
+        # Autocommit connection with the per-connection PRAGMAs applied once
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None,
+                               cached_statements=256)
+        # Rows unpack like tuples and can also be read by column name
+        conn.row_factory = sqlite3.Row
+        # journal_mode returns the mode actually in effect (e.g. "memory" for :memory: databases)
+        self.journal_mode = conn.execute("PRAGMA journal_mode = WAL;").fetchone()[0].lower()
+        conn.execute("PRAGMA synchronous = NORMAL;" if self.journal_mode == "wal" else "PRAGMA synchronous = FULL;")
+        conn.execute("PRAGMA temp_store = MEMORY;")
+        conn.execute("PRAGMA cache_size = -16384;")
+        conn.execute("PRAGMA busy_timeout = 5000;")
         conn.execute("PRAGMA foreign_keys = ON;")
         return conn
 
+    def close(self) -> None:
+        self.pool.close()
+
 
 class BaseRepository:
     def __init__(self, db: DBConnection):
         self.db = db
 
     def execute(self, sql: str, params: tuple = ()) -> None:
-        with self.db.connect() as conn:
+        conn = self.db.pool.acquire()
+        try:
             conn.execute(sql, params)
-            conn.commit()
+        finally:
+            self.db.pool.release(conn)
+
+    def executemany(self, sql: str, rows) -> None:
+        conn = self.db.pool.acquire()
+        try:
+            conn.executemany(sql, rows)
+        finally:
+            self.db.pool.release(conn)
 
     def fetchone(self, sql: str, params: tuple = ()):
-        with self.db.connect() as conn:
-            cur = conn.execute(sql, params)
-            return cur.fetchone()
+        conn = self.db.pool.acquire()
+        try:
+            return conn.execute(sql, params).fetchone()
+        finally:
+            self.db.pool.release(conn)
 
     def fetchall(self, sql: str, params: tuple = ()):
-        with self.db.connect() as conn:
-            cur = conn.execute(sql, params)
-            return cur.fetchall()
+        conn = self.db.pool.acquire()
+        try:
+            return conn.execute(sql, params).fetchall()
+        finally:
+            self.db.pool.release(conn)
 
+    def iter(self, sql: str, params: tuple = ()) -> Iterator[sqlite3.Row]:
+        # Streams rows; the connection stays checked out until the generator is exhausted or closed
+        conn = self.db.pool.acquire()
+        try:
+            yield from conn.execute(sql, params)
+        finally:
+            self.db.pool.release(conn)
+
+
+SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS users (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    username TEXT UNIQUE NOT NULL,
+    password_hash TEXT NOT NULL,
+    role TEXT NOT NULL CHECK(role IN ('admin','doctor','receptionist'))
+);
+
+CREATE TABLE IF NOT EXISTS patients (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL,
+    age INTEGER NOT NULL CHECK(age >= 0),
+    gender TEXT NOT NULL CHECK(gender IN ('Male','Female')),
+    phone TEXT,
+    address TEXT
+);
+
+CREATE TABLE IF NOT EXISTS doctors (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL,
+    specialty TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS appointments (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    patient_id INTEGER NOT NULL,
+    doctor_id INTEGER NOT NULL,
+    appt_datetime TEXT NOT NULL,
+    reason TEXT,
+    status TEXT NOT NULL DEFAULT 'Scheduled',
+    FOREIGN KEY(patient_id) REFERENCES patients(id) ON DELETE CASCADE,
+    FOREIGN KEY(doctor_id) REFERENCES doctors(id) ON DELETE CASCADE
+);
+
+-- A doctor can hold only one scheduled appointment per slot
+CREATE UNIQUE INDEX IF NOT EXISTS uq_appt_slot ON appointments(doctor_id, appt_datetime) WHERE status = 'Scheduled';
+-- Newest-first listing
+CREATE INDEX IF NOT EXISTS idx_appt_order ON appointments(appt_datetime DESC);
+"""
 
-class UserDB(BaseRepository):
-    def create_table(self) -> None:
-        self.execute("""
-        CREATE TABLE IF NOT EXISTS users (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            username TEXT UNIQUE NOT NULL,
-            password_hash TEXT NOT NULL,
-            role TEXT NOT NULL CHECK(role IN ('admin','doctor','receptionist'))
-        );
-        """)
 
+_SQL_CREATE_USER = "INSERT INTO users (username, password_hash, role) VALUES (?, ?, ?);"
+_SQL_CREATE_USER_IF_MISSING = "INSERT OR IGNORE INTO users (username, password_hash, role) VALUES (?, ?, ?);"
+_SQL_FIND_USER = "SELECT id, username, password_hash, role FROM users WHERE username = ?;"
+
+
+class UserDB(BaseRepository):
     def create_user(self, username: str, password_hash: str, role: str) -> None:
-        self.execute(
-            "INSERT INTO users (username, password_hash, role) VALUES (?, ?, ?);",
-            (username, password_hash, role)
-        )
+        self.execute(_SQL_CREATE_USER, (username, password_hash, role))
+
+    def create_users_bulk(self, rows: list[tuple[str, str, str]]) -> None:
+        # Existing usernames are skipped
+        with self.db.pool.transaction():
+            self.executemany(_SQL_CREATE_USER_IF_MISSING, rows)
 
     def find_user(self, username: str):
-        return self.fetchone(
-            "SELECT id, username, password_hash, role FROM users WHERE username = ?;",
-            (username,)
-        )
+        return self.fetchone(_SQL_FIND_USER, (username,))
 
 
-class PatientDB(BaseRepository):
-    def create_table(self) -> None:
-        self.execute("""
-        CREATE TABLE IF NOT EXISTS patients (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT NOT NULL,
-            age INTEGER NOT NULL CHECK(age >= 0),
-            gender TEXT NOT NULL CHECK(gender IN ('Male','Female')),
-            phone TEXT,
-            address TEXT
-        );
-        """)
+_SQL_SAVE_PATIENT = """
+INSERT INTO patients (name, age, gender, phone, address)
+VALUES (?, ?, ?, ?, ?);
+"""
+_SQL_GET_PATIENT = """
+SELECT id, name, age, gender, phone, address
+FROM patients WHERE id = ?;
+"""
+_SQL_LIST_PATIENTS = "SELECT id, name, age, gender FROM patients ORDER BY id DESC;"
+
 
+class PatientDB(BaseRepository):
     def save_patient(self, name: str, age: int, gender: str, phone: str, address: str) -> None:
-        self.execute("""
-        INSERT INTO patients (name, age, gender, phone, address)
-        VALUES (?, ?, ?, ?, ?);
-        """, (name, age, gender, phone, address))
+        self.execute(_SQL_SAVE_PATIENT, (name, age, gender, phone, address))
+
+    def save_patients_bulk(self, rows: list[tuple[str, int, str, str, str]]) -> None:
+        # rows: (name, age, gender, phone, address)
+        with self.db.pool.transaction():
+            self.executemany(_SQL_SAVE_PATIENT, rows)
 
     def get_patient_by_id(self, patient_id: int):
-        return self.fetchone("""
-        SELECT id, name, age, gender, phone, address
-        FROM patients WHERE id = ?;
-        """, (patient_id,))
+        return self.fetchone(_SQL_GET_PATIENT, (patient_id,))
+
+    def list_patients(self) -> Iterator[sqlite3.Row]:
+        return self.iter(_SQL_LIST_PATIENTS)
+
 
-    def list_patients(self):
-        return self.fetchall("""
-        SELECT id, name, age, gender FROM patients ORDER BY id DESC;
-        """)
+_SQL_LIST_DOCTORS = "SELECT id, name, specialty FROM doctors ORDER BY id;"
+_SQL_COUNT_DOCTORS = "SELECT COUNT(*) FROM doctors;"
+_SQL_SAVE_DOCTOR = "INSERT INTO doctors (name, specialty) VALUES (?, ?);"
 
 
 class DoctorDB(BaseRepository):
-    def create_table(self) -> None:
-        self.execute("""
-        CREATE TABLE IF NOT EXISTS doctors (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT NOT NULL,
-            specialty TEXT NOT NULL
-        );
-        """)
+    def __init__(self, db: DBConnection):
+        super().__init__(db)
+        # Doctors are read-mostly; rows are cached by id on first read
+        self._cache: dict[int, sqlite3.Row] | None = None
+
+    def _doctors(self) -> dict[int, sqlite3.Row]:
+        if self._cache is None:
+            rows = self.fetchall(_SQL_LIST_DOCTORS)
+            self._cache = {row["id"]: row for row in rows}
+        return self._cache
 
     def seed_default_doctors(self) -> None:
         # Insert some doctors if table is empty
-        row = self.fetchone("SELECT COUNT(*) FROM doctors;")
+        row = self.fetchone(_SQL_COUNT_DOCTORS)
         if row and row[0] == 0:
             doctors = [
                 ("Dr. Ahmed", "General"),
                 ("Dr. Sara", "Pediatrics"),
                 ("Dr. Omar", "Dermatology"),
             ]
-            with self.db.connect() as conn:
-                conn.executemany("INSERT INTO doctors (name, specialty) VALUES (?, ?);", doctors)
-                conn.commit()
+            self.executemany(_SQL_SAVE_DOCTOR, doctors)
+            self._cache = None
 
     def list_doctors(self):
-        return self.fetchall("SELECT id, name, specialty FROM doctors ORDER BY id;")
+        return list(self._doctors().values())
 
     def get_doctor_by_id(self, doctor_id: int):
-        return self.fetchone("SELECT id, name, specialty FROM doctors WHERE id = ?;", (doctor_id,))
+        return self._doctors().get(doctor_id)
+
+
+_SQL_SAVE_APPOINTMENT = """
+INSERT INTO appointments (patient_id, doctor_id, appt_datetime, reason)
+VALUES (?, ?, ?, ?);
+"""
+_SQL_LIST_APPOINTMENTS = """
+SELECT a.id, p.name, d.name, a.appt_datetime, a.status
+FROM appointments a
+JOIN patients p ON p.id = a.patient_id
+JOIN doctors d ON d.id = a.doctor_id
+ORDER BY a.appt_datetime DESC
+LIMIT ? OFFSET ?;
+"""
+APPOINTMENTS_PAGE_SIZE = 100
 
 
 class AppointmentDB(BaseRepository):
-    def create_table(self) -> None:
-        self.execute("""
-        CREATE TABLE IF NOT EXISTS appointments (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            patient_id INTEGER NOT NULL,
-            doctor_id INTEGER NOT NULL,
-            appt_datetime TEXT NOT NULL,
-            reason TEXT,
-            status TEXT NOT NULL DEFAULT 'Scheduled',
-            FOREIGN KEY(patient_id) REFERENCES patients(id) ON DELETE CASCADE,
-            FOREIGN KEY(doctor_id) REFERENCES doctors(id) ON DELETE CASCADE
-        );
-        """)
-
-    def is_doctor_available(self, doctor_id: int, appt_datetime: str) -> bool:
-        row = self.fetchone("""
-        SELECT COUNT(*)
-        FROM appointments
-        WHERE doctor_id = ?
-          AND appt_datetime = ?
-          AND status = 'Scheduled';
-        """, (doctor_id, appt_datetime))
-        return (row[0] == 0) if row else True
-
-    def save_appointment(self, patient_id: int, doctor_id: int, appt_datetime: str, reason: str) -> None:
-        self.execute("""
-        INSERT INTO appointments (patient_id, doctor_id, appt_datetime, reason)
-        VALUES (?, ?, ?, ?);
-        """, (patient_id, doctor_id, appt_datetime, reason))
-
-    def list_appointments(self):
-        return self.fetchall("""
-        SELECT a.id, p.name, d.name, a.appt_datetime, a.status
-        FROM appointments a
-        JOIN patients p ON p.id = a.patient_id
-        JOIN doctors d ON d.id = a.doctor_id
-        ORDER BY a.appt_datetime DESC;
-        """)
+    def save_appointment(self, patient_id: int, doctor_id: int, appt_datetime: str, reason: str) -> bool:
+        # Returns False if the doctor already has a scheduled appointment in this slot
+        try:
+            self.execute(_SQL_SAVE_APPOINTMENT, (patient_id, doctor_id, appt_datetime, reason))
+        except sqlite3.IntegrityError as e:
+            if "UNIQUE constraint failed" in str(e):
+                return False
+            raise
+        return True
+
+    def save_appointments_bulk(self, rows: list[tuple[int, int, str, str]]) -> None:
+        # rows: (patient_id, doctor_id, appt_datetime, reason); a booked slot rolls back the whole batch
+        with self.db.pool.transaction():
+            self.executemany(_SQL_SAVE_APPOINTMENT, rows)
+
+    def list_appointments(self, offset: int = 0, limit: int = APPOINTMENTS_PAGE_SIZE) -> list[sqlite3.Row]:
+        # Newest first, one bounded page at a time (rows come straight off idx_appt_order, no sort)
+        return self.fetchall(_SQL_LIST_APPOINTMENTS, (limit, offset))
 
 
 # =========================
 # Entity Layer (Optional)
 # =========================
 
-@dataclass
-class CurrentUser:
+class CurrentUser(NamedTuple):
     user_id: int
     username: str
     role: str
@@ -204,7 +343,8 @@ class AuthController:
             return None
 
         user_id, uname, stored_hash, role = user
-        if self.hash_password(password) != stored_hash:
+        # Constant-time comparison so response time does not leak how much of the hash matched
+        if not hmac.compare_digest(self.hash_password(password), stored_hash):
             return None
 
         return CurrentUser(user_id=user_id, username=uname, role=role)
@@ -214,26 +354,32 @@ class PatientController:
     def __init__(self, patient_db: PatientDB):
         self.patient_db = patient_db
 
-    def validate_patient_data(self, name: str, age: str, gender: str) -> tuple[bool, str]:
+    def validate_patient_data(self, name: str, age: str, gender: str) -> tuple[bool, str, int | None]:
+        # Returns (ok, message, parsed age) so the age string is only parsed here
+        if gender not in {"Male", "Female"}:
+            return False, "Gender must be Male or Female.", None
         if not name.strip():
-            return False, "Name is required."
-        if not age.isdigit():
-            return False, "Age must be a number."
+            return False, "Name is required.", None
+        # ASCII digits only: rejects signs, spaces, underscores and non-ASCII digits
+        if not (age.isascii() and age.isdigit()):
+            return False, "Age must be a number.", None
         age_int = int(age)
-        if age_int < 0 or age_int > 120:
-            return False, "Age must be between 0 and 120."
-        if gender not in ("Male", "Female"):
-            return False, "Gender must be Male or Female."
-        return True, ""
+        if age_int > 120:
+            return False, "Age must be between 0 and 120.", None
+        return True, "", age_int
 
     def register_patient(self, name: str, age: str, gender: str, phone: str, address: str) -> tuple[bool, str]:
-        ok, msg = self.validate_patient_data(name, age, gender)
+        ok, msg, age_int = self.validate_patient_data(name, age, gender)
         if not ok:
             return False, msg
-        self.patient_db.save_patient(name=name.strip(), age=int(age), gender=gender, phone=phone.strip(), address=address.strip())
+        self.patient_db.save_patient(name=name.strip(), age=age_int, gender=gender, phone=phone.strip(), address=address.strip())
         return True, "Patient registered successfully."
 
 
+# Expected format: YYYY-MM-DD HH:MM
+_DT_RE = re.compile(r"(\d{4})-(\d{2})-(\d{2}) (\d{2}):(\d{2})", re.ASCII)
+
+
 class AppointmentController:
     def __init__(self, appointment_db: AppointmentDB, patient_db: PatientDB, doctor_db: DoctorDB):
         self.appointment_db = appointment_db
@@ -241,12 +387,15 @@ class AppointmentController:
         self.doctor_db = doctor_db
 
     def validate_datetime(self, dt_str: str) -> tuple[bool, str]:
-        try:
-            # Expected format: YYYY-MM-DD HH:MM
-            datetime.strptime(dt_str, "%Y-%m-%d %H:%M")
-            return True, ""
-        except ValueError:
-            return False, "Invalid date/time format. Use: YYYY-MM-DD HH:MM"
+        m = _DT_RE.fullmatch(dt_str)
+        if m:
+            try:
+                # Rejects impossible dates/times such as 2025-02-30 or 25:00
+                datetime(*map(int, m.groups()))
+                return True, ""
+            except ValueError:
+                pass
+        return False, "Invalid date/time format. Use: YYYY-MM-DD HH:MM"
 
     def schedule_appointment(self, patient_id: str, doctor_id: str, appt_datetime: str, reason: str) -> tuple[bool, str]:
         if not patient_id.isdigit():
@@ -257,19 +406,25 @@ class AppointmentController:
         pid = int(patient_id)
         did = int(doctor_id)
 
-        if not self.patient_db.get_patient_by_id(pid):
-            return False, "Patient not found."
-        if not self.doctor_db.get_doctor_by_id(did):
-            return False, "Doctor not found."
-
         ok, msg = self.validate_datetime(appt_datetime)
         if not ok:
             return False, msg
 
-        if not self.appointment_db.is_doctor_available(did, appt_datetime):
-            return False, "This doctor is not available at the selected time."
+        if not self.doctor_db.get_doctor_by_id(did):
+            return False, "Doctor not found."
 
-        self.appointment_db.save_appointment(pid, did, appt_datetime, reason.strip())
+        # The patient is validated by the foreign key on insert
+        try:
+            booked = self.appointment_db.save_appointment(pid, did, appt_datetime, reason.strip())
+        except sqlite3.IntegrityError as e:
+            if "FOREIGN KEY constraint failed" not in str(e):
+                raise
+            # SQLite does not say which key failed; only this error path pays for the lookup
+            if not self.patient_db.get_patient_by_id(pid):
+                return False, "Patient not found."
+            return False, "Doctor not found."
+        if not booked:
+            return False, "This doctor is not available at the selected time."
         return True, "Appointment scheduled successfully."
 
 
@@ -277,6 +432,13 @@ class AppointmentController:
 # UI Layer (Console UI)
 # =========================
 
+# Roles allowed to register patients and schedule appointments
+STAFF_ROLES = frozenset({"admin", "receptionist"})
+
+# Rows rendered per stdout write, so long listings are never held in memory as one string
+LISTING_BATCH_SIZE = 100
+
+
 class LoginUI:
     def __init__(self, auth_controller: AuthController):
         self.auth = auth_controller
@@ -331,7 +493,7 @@ class ClinicMenuUI:
                 print("❌ Invalid choice.")
 
     def register_patient_flow(self, current_user: CurrentUser) -> None:
-        if current_user.role not in ("admin", "receptionist"):
+        if current_user.role not in STAFF_ROLES:
             print("❌ Access denied. Only admin/receptionist can register patients.")
             return
 
@@ -346,7 +508,7 @@ class ClinicMenuUI:
         print(("✅ " if ok else "❌ ") + msg)
 
     def schedule_appointment_flow(self, current_user: CurrentUser) -> None:
-        if current_user.role not in ("admin", "receptionist"):
+        if current_user.role not in STAFF_ROLES:
             print("❌ Access denied. Only admin/receptionist can schedule appointments.")
             return
 
@@ -366,57 +528,81 @@ class ClinicMenuUI:
     def list_patients_flow(self) -> None:
         print("\n--- Patients ---")
         rows = self.patient_db.list_patients()
-        if not rows:
+        empty = True
+        while batch := list(islice(rows, LISTING_BATCH_SIZE)):
+            empty = False
+            sys.stdout.write("".join(
+                f"ID={pid} | {name} | {age} | {gender}\n"
+                for pid, name, age, gender in batch
+            ))
+        if empty:
             print("(No patients)")
-            return
-        for pid, name, age, gender in rows:
-            print(f"ID={pid} | {name} | {age} | {gender}")
 
     def list_doctors_flow(self) -> None:
         print("\n--- Doctors ---")
         rows = self.doctor_db.list_doctors()
-        for did, name, specialty in rows:
-            print(f"ID={did} | {name} | {specialty}")
+        sys.stdout.write("".join(
+            f"ID={did} | {name} | {specialty}\n"
+            for did, name, specialty in rows
+        ))
 
     def list_appointments_flow(self) -> None:
         print("\n--- Appointments ---")
-        rows = self.appointment_db.list_appointments()
-        if not rows:
-            print("(No appointments)")
-            return
-        for aid, patient_name, doctor_name, appt_dt, status in rows:
-            print(f"ID={aid} | Patient={patient_name} | Doctor={doctor_name} | {appt_dt} | {status}")
+        offset = 0
+        while True:
+            rows = self.appointment_db.list_appointments(offset)
+            if not rows:
+                if offset == 0:
+                    print("(No appointments)")
+                return
+            sys.stdout.write("".join(
+                f"ID={aid} | Patient={patient_name} | Doctor={doctor_name} | {appt_dt} | {status}\n"
+                for aid, patient_name, doctor_name, appt_dt, status in rows
+            ))
+            if len(rows) < APPOINTMENTS_PAGE_SIZE:
+                return
+            offset += len(rows)
+            if input("Show more? (y/n): ").strip().lower() != "y":
+                return
 
 
 # =========================
 # Setup / Main
 # =========================
 
+# Default accounts as (username, password_hash, role); hashes are
+# AuthController.hash_password of admin123 / recep123 / doc123
+DEFAULT_USERS = [
+    ("admin", "240be518fabd2724ddb6f04eeb1da5967448d7e831c08c8fa822809f74c720a9", "admin"),
+    ("reception", "5d37ed314cf2b5c8462b52b12cd512e2ac4a180e75598da4f12bfb0dea6d0a67", "receptionist"),
+    ("doctor", "c3362e4da49c24d379b72152ae6c99f1fa035f52829dceed715a7bf8bb464b98", "doctor"),
+]
+
+
+def setup_schema(db: DBConnection) -> None:
+    # Create all tables and seed doctors under a single commit
+    with db.pool.connection() as conn:
+        try:
+            # executescript() commits any pending transaction first, so BEGIN goes inside the script
+            conn.executescript("BEGIN IMMEDIATE;" + SCHEMA_SQL)
+            DoctorDB(db).seed_default_doctors()
+            conn.execute("COMMIT;")
+        except BaseException:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK;")
+            raise
+
+
 def setup_database(db: DBConnection) -> tuple[UserDB, PatientDB, DoctorDB, AppointmentDB]:
+    setup_schema(db)
+
     user_db = UserDB(db)
     patient_db = PatientDB(db)
     doctor_db = DoctorDB(db)
     appointment_db = AppointmentDB(db)
 
-    user_db.create_table()
-    patient_db.create_table()
-    doctor_db.create_table()
-    appointment_db.create_table()
-
-    doctor_db.seed_default_doctors()
-
     # Create default accounts if not exist
-    auth = AuthController(user_db)
-    defaults = [
-        ("admin", "admin123", "admin"),
-        ("reception", "recep123", "receptionist"),
-        ("doctor", "doc123", "doctor"),
-    ]
-    for u, p, r in defaults:
-        try:
-            user_db.create_user(u, auth.hash_password(p), r)
-        except sqlite3.IntegrityError:
-            pass  # already exists
+    user_db.create_users_bulk(DEFAULT_USERS)
 
     return user_db, patient_db, doctor_db, appointment_db
 